@@ -15,8 +15,19 @@
 # 11      149mm     149mm
 # 12      37.2mm    18.6mm
 
-from itertools import zip_longest
-from typing import Union
+from functools import lru_cache
+from math import ceil
+from typing import NamedTuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # Only encode_many and decode_many need numpy.
+    np = None  # type: ignore[assignment]
+
+try:
+    from geohash_numba import numba_decode_exactly, numba_encode
+except ImportError:  # No numba, stick to pure Python.
+    numba_decode_exactly = numba_encode = None  # type: ignore[assignment]
 
 
 base32 = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'j', 'k', 'm', 'n', 'p',
@@ -24,6 +35,32 @@ base32 = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'b', 'c', 'd', 'e',
 dict32 = {'0': 0, '1': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'b': 10, 'c': 11, 'd': 12,
           'e': 13, 'f': 14, 'g': 15, 'h': 16, 'j': 17, 'k': 18, 'm': 19, 'n': 20, 'p': 21, 'q': 22, 'r': 23, 's': 24,
           't': 25, 'u': 26, 'v': 27, 'w': 28, 'x': 29, 'y': 30, 'z': 31}
+# Maps every ASCII char to the digit int(x, 32) reads for it.  Anything outside base32 maps to '!', which int rejects.
+trans32 = str.maketrans({**{chr(i): '!' for i in range(128)}, **dict(zip(base32, '0123456789abcdefghijklmnopqrstuv'))})
+# Base32 value of each ASCII char by its ord, 255 if it isn't base32, and the 5 bit string of each value.
+lut32 = bytes(dict32.get(chr(i), 255) for i in range(128))
+bits32 = [format(i, '05b') for i in range(32)]
+# Turns bytes holding base32 values into the base32 chars themselves, for bytes.translate.
+chars32 = bytes.maketrans(bytes(range(32)), ''.join(base32).encode())
+
+
+class DecodedArrays(NamedTuple):
+    """
+    What decode_many gives back.  One array per field rather than one tuple per geohash, so the results can go
+    straight into more numpy math.
+    """
+    lons: 'np.ndarray'
+    lats: 'np.ndarray'
+    lon_errs: 'np.ndarray'
+    lat_errs: 'np.ndarray'
+
+    def to_cells(self) -> list:
+        """
+        One (lon, lat, lon_err, lat_err) tuple per geohash, for when you do want them one at a time.
+        :return: list of tuples, flattened in C order
+        """
+        return list(zip(self.lons.ravel().tolist(), self.lats.ravel().tolist(), self.lon_errs.ravel().tolist(),
+                        self.lat_errs.ravel().tolist()))
 
 
 def encode(lon: float, lat: float, precision: int = 12) -> str:
@@ -34,34 +71,160 @@ def encode(lon: float, lat: float, precision: int = 12) -> str:
     :param precision: Bits of precision.
     :return: Geohash string
     """
-    lon_bits = get_bits(lon, precision, 180)
-    lat_bits = get_bits(lat, precision, 90)
-    geobits = ''.join(''.join(x) for x in zip_longest(lon_bits, lat_bits, fillvalue=''))
-    geohash = ''
-    for i in range(precision):
-        geohash += base32[int(geobits[i*5:i*5+5], 2)]
-    return geohash
+    if numba_encode is not None:
+        return numba_encode(lon, lat, precision)
+    if precision == 12:
+        return encode_p12(lon, lat)
+    total_bits = precision * 5
+    lon_len, lat_len = sum(divmod(total_bits, 2)), total_bits // 2
+    return ints_to_geohash(quantize(lon, lon_len, 180), quantize(lat, lat_len, 90), precision)
+
+
+def encode_p12(lon: float, lat: float) -> str:
+    """
+    encode at the default precision of 12, with interleave and bits_to_geohash written out in full for 30 lon bits
+    and 30 lat bits, so no loops.
+    :param lon: Longitude
+    :param lat: Latitude
+    :return: Geohash string
+    """
+    x = quantize(lon, 30, 180)
+    y = quantize(lat, 30, 90)
+    x = (x | x << 16) & 0x0000FFFF0000FFFF
+    y = (y | y << 16) & 0x0000FFFF0000FFFF
+    x = (x | x << 8) & 0x00FF00FF00FF00FF
+    y = (y | y << 8) & 0x00FF00FF00FF00FF
+    x = (x | x << 4) & 0x0F0F0F0F0F0F0F0F
+    y = (y | y << 4) & 0x0F0F0F0F0F0F0F0F
+    x = (x | x << 2) & 0x3333333333333333
+    y = (y | y << 2) & 0x3333333333333333
+    x = (x | x << 1) & 0x5555555555555555
+    y = (y | y << 1) & 0x5555555555555555
+    x = x << 1 | y
+    x = x & 0xFFFFFFFFFF | (x & 0xFFFFF0000000000) << 24
+    x = x & 0x00000000000FFFFF00000000000FFFFF | (x & 0x000000FFFFF00000000000FFFFF00000) << 12
+    x = x & 0x000003FF000003FF000003FF000003FF | (x & 0x000FFC00000FFC00000FFC00000FFC00) << 6
+    x = x & 0x001F001F001F001F001F001F001F001F | (x & 0x03E003E003E003E003E003E003E003E0) << 3
+    return x.to_bytes(12, 'big').translate(chars32).decode()
 
 
-def get_bits(degrees: float, precision: int, range_ends: int) -> str:
+def quantize(degrees: float, length: int, range_ends: int) -> int:
     """
-    Gives the bit string of either lat or lon for zipping in encoding of geohash.
+    Gives the cell index of either lat or lon along its axis, same as bisecting the range length times.
+    A coordinate sitting exactly on a cell edge goes to the lower cell, matching the bisection.
     :param degrees: The lon or lat, as a float
-    :param precision: Number of characters for the end result geohash
+    :param length: Number of bits for this axis
     :param range_ends: 180 or 90 for lon or lat, respectively
-    :return: string of bits
+    :return: cell index, 0 to 2**length - 1
     """
-    result = ''
-    tup_range = (-range_ends, range_ends)
-    for i in range(sum(divmod(precision * 5, 2))):
-        mid = sum(tup_range) / 2
-        if degrees > mid:
-            result += '1'
-            tup_range = (mid, tup_range[1])
-        else:
-            result += '0'
-            tup_range = (tup_range[0], mid)
-    return result
+    if degrees != degrees:  # NaN is never above a midpoint, so the bisection puts it in the lowest cell.
+        return 0
+    if length > 44:
+        # Past 44 bits (precision 18 and up) the edges no longer fit in a double, and the bisection's rounded midpoints
+        # are the ones to match.
+        index, low, high = 0, float(-range_ends), float(range_ends)
+        for _ in range(length):
+            mid = (low + high) / 2
+            bit = degrees > mid
+            index = index << 1 | int(bit)
+            if bit:
+                low = mid
+            else:
+                high = mid
+        return index
+    cells = 1 << length
+    degrees = min(max(degrees, -range_ends), range_ends)
+    index = max(ceil((degrees + range_ends) / (2 * range_ends) * cells) - 1, 0)
+    # Rounding in degrees + range_ends can drop a point just above an edge into the cell below.  The edges are exact,
+    # so compare against them the way the bisection does.
+    while index < cells - 1 and degrees > (index + 1) * 2 * range_ends / cells - range_ends:
+        index += 1
+    return index
+
+
+def interleave(lon_int: int, lat_int: int, lon_len: int, lat_len: int) -> int:
+    """
+    Interleaves lon and lat indexes into geohash bits, lon first.  Morton interleave, 32 bits of each at a time.
+    :param lon_int: lon cell index
+    :param lat_int: lat cell index
+    :param lon_len: Number of lon bits
+    :param lat_len: Number of lat bits, equal to lon_len or one less
+    :return: geohash bits as an int, lon_len + lat_len long
+    """
+    odd = lon_len - lat_len
+    geoint = 0
+    for shift in range(0, lon_len, 32):
+        pair = spread_bits(lon_int >> shift & 0xFFFFFFFF) << 1 - odd | spread_bits(lat_int >> shift & 0xFFFFFFFF) << odd
+        geoint |= pair << 2 * shift
+    return geoint
+
+
+def deinterleave(geoint: int, lon_len: int, lat_len: int) -> tuple:
+    """
+    Splits geohash bits back into lon and lat indexes.  Inverse of interleave, 32 bits of each at a time.
+    :param geoint: geohash bits as an int, lon_len + lat_len long
+    :param lon_len: Number of lon bits
+    :param lat_len: Number of lat bits, equal to lon_len or one less
+    :return: (lon_int, lat_int)
+    """
+    odd = lon_len - lat_len
+    lon_int = lat_int = 0
+    for shift in range(0, lon_len, 32):
+        lon_int |= compact_bits(geoint >> 2 * shift + 1 - odd) << shift
+        lat_int |= compact_bits(geoint >> 2 * shift + odd) << shift
+    return lon_int, lat_int
+
+
+def index_to_degrees(index: int, length: int, range_ends: int) -> tuple:
+    """
+    Returns center of a lon or lat cell and its degree of precision.  Inverse of quantize.
+    :param index: cell index along the axis
+    :param length: Number of bits for this axis
+    :param range_ends: 180 or 90 for lon or lat, respectively
+    :return: (degrees, DOP)
+    """
+    precision = range_ends / (1 << length)
+    return (2 * index + 1) * precision - range_ends, precision
+
+
+def decode_to_ints(geohash: str) -> tuple:
+    """
+    Geohash in, lon and lat cell indexes out, along with how many bits each has.
+    :param geohash: Geohash string
+    :return: (lon_int, lat_int, lon_len, lat_len)
+    """
+    total_bits = len(geohash) * 5
+    lon_len, lat_len = sum(divmod(total_bits, 2)), total_bits // 2
+    return deinterleave(geohash_to_int(geohash), lon_len, lat_len) + (lon_len, lat_len)
+
+
+def ints_to_geohash(lon_int: int, lat_int: int, hash_len: int) -> str:
+    """
+    Lon and lat cell indexes in, geohash out.  Inverse of decode_to_ints.
+    :param lon_int: lon cell index
+    :param lat_int: lat cell index
+    :param hash_len: Number of characters in the geohash
+    :return: Geohash string
+    """
+    total_bits = hash_len * 5
+    return bits_to_geohash(interleave(lon_int, lat_int, sum(divmod(total_bits, 2)), total_bits // 2), hash_len)
+
+
+def bits_to_geohash(geoint: int, hash_len: int) -> str:
+    """
+    Geohash bits in, geohash out.  Spreads each 5 bit group out to a byte of its own, then translates the bytes to
+    base32 chars, 16 chars at a time.
+    :param geoint: geohash bits as an int, hash_len * 5 long
+    :param hash_len: Number of characters in the geohash
+    :return: Geohash string
+    """
+    if hash_len > 16:
+        return bits_to_geohash(geoint >> 80, hash_len - 16) + bits_to_geohash(geoint & (1 << 80) - 1, 16)
+    x = geoint & 0xFFFFFFFFFF | (geoint & 0xFFFFFFFFFF0000000000) << 24
+    x = x & 0x00000000000FFFFF00000000000FFFFF | (x & 0x000000FFFFF00000000000FFFFF00000) << 12
+    x = x & 0x000003FF000003FF000003FF000003FF | (x & 0x000FFC00000FFC00000FFC00000FFC00) << 6
+    x = x & 0x001F001F001F001F001F001F001F001F | (x & 0x03E003E003E003E003E003E003E003E0) << 3
+    return x.to_bytes(16, 'big')[16 - hash_len:].translate(chars32).decode()
 
 
 def decode(geohash: str, geotype: str = 'point') -> Union[tuple, list]:
@@ -75,21 +238,39 @@ def decode(geohash: str, geotype: str = 'point') -> Union[tuple, list]:
     :param geotype: 'point', 'pointerr', 'pointround', or 'polygon'
     :return:
     """
-    geobits = get_geobits(geohash)
-    lon_bits = geobits[::2]
-    lat_bits = geobits[1::2]
-    lon, lon_err = get_degrees(lon_bits, 180)
-    lat, lat_err = get_degrees(lat_bits, 90)
+    if geotype not in ('pointerr', 'polygon'):
+        return decode_point(geohash)
+    if numba_decode_exactly is not None and len(geohash) <= 12:
+        lon, lat, lon_err, lat_err = numba_decode_exactly(geohash)
+    else:
+        lon_int, lat_int, lon_len, lat_len = decode_to_ints(geohash)
+        lon, lon_err = index_to_degrees(lon_int, lon_len, 180)
+        lat, lat_err = index_to_degrees(lat_int, lat_len, 90)
     if geotype == 'pointerr':
         response = [lat, lon, lat_err, lon_err]
-    elif geotype == 'polygon':
+    else:
         response = [((lon - lon_err), (lat - lat_err)), ((lon + lon_err), (lat - lat_err)),
                     ((lon - lon_err), (lat + lat_err)), ((lon + lon_err), (lat + lat_err))]
-    else:
-        response = (lon, lat)
     return response
 
 
+def decode_point(geohash: str) -> tuple:
+    """
+    Decode geohash to its center point, same as decode's default 'point', minus the margin of error work.
+    :param geohash: Geohash string
+    :return: (lon, lat) tuple
+    """
+    if len(geohash) > 12:
+        lon_int, lat_int, lon_len, lat_len = decode_to_ints(geohash)
+    else:  # Fits in 64 bits, so one compact_bits per axis does it.
+        total_bits = len(geohash) * 5
+        lon_len, lat_len = sum(divmod(total_bits, 2)), total_bits // 2
+        geoint = geohash_to_int(geohash)
+        lon_int = compact_bits(geoint >> 1 - lon_len + lat_len)
+        lat_int = compact_bits(geoint >> lon_len - lat_len)
+    return (2 * lon_int + 1) * (180 / (1 << lon_len)) - 180, (2 * lat_int + 1) * (90 / (1 << lat_len)) - 90
+
+
 def get_degrees(bits: str, range_ends: int) -> tuple:
     """
     Returns tuple of degrees and degree of precision
@@ -97,7 +278,7 @@ def get_degrees(bits: str, range_ends: int) -> tuple:
     :param range_ends: 180 or 90 for lon or lat, respectively
     :return: (degrees, DOP)
     """
-    tup_range = (-range_ends, range_ends)
+    tup_range: tuple = (-range_ends, range_ends)
     for i in bits:
         mid = sum(tup_range) / 2
         if i == '0':
@@ -110,27 +291,190 @@ def get_degrees(bits: str, range_ends: int) -> tuple:
 
 
 def neighbors(geohash: str) -> list:
-    geobits = get_geobits(geohash)
-    lon_bits = geobits[::2]
-    lat_bits = geobits[1::2]
-    lon_int = int(lon_bits, 2)
-    lat_int = int(lat_bits, 2)
-    lon_len = len(lon_bits)
-    lat_len = len(lat_bits)
-    hash_len = len(geohash)
-    lon_list = [lon_int - 1, lon_int, lon_int + 1]
-    lat_list = [lat_int + 1, lat_int, lat_int - 1]
-    geo_list = []
-    for i in lon_list:
-        lon_bits = bin(i)[2:].zfill(lon_len)
-        for j in lat_list:
-            lat_bits = bin(j)[2:].zfill(lat_len)
-            geobits = ''.join(''.join(x) for x in zip_longest(lon_bits, lat_bits, fillvalue=''))
-            geohash = ''
-            for k in range(hash_len):
-                geohash += base32[int(geobits[k * 5:k * 5 + 5], 2)]
-            geo_list.append(geohash)
-    return geo_list
+    """
+    Gives the geohashes of the surrounding boxes, and the box itself, same length as the given geohash.
+    Order is upper left, left, lower left, upper middle, self, lower middle, upper right, right, lower right.
+    Wraps around the date line.  At the poles there's nothing above or below, so those boxes are left out.
+    Results are cached, as the same cells tend to get asked about over and over.
+    :param geohash: Geohash string
+    :return: list of nine geohashes, six at the poles
+    """
+    return list(neighbor_tuple(geohash))
+
+
+@lru_cache(maxsize=65536)
+def neighbor_tuple(geohash: str) -> tuple:
+    """
+    Cached work behind neighbors.  Tuple so no caller can change what's in the cache.
+    :param geohash: Geohash string
+    :return: tuple of nine geohashes, six at the poles
+    """
+    lon_int, lat_int, lon_len, lat_len = decode_to_ints(geohash)
+    # Masking wraps -1 and 2**lon_len around the date line; j >> lat_len is only 0 for rows between the poles.
+    lon_mask = (1 << lon_len) - 1
+    lon_list = [interleave(i & lon_mask, 0, lon_len, lat_len) for i in (lon_int - 1, lon_int, lon_int + 1)]
+    lat_list = [interleave(0, j, lon_len, lat_len) for j in (lat_int + 1, lat_int, lat_int - 1) if not j >> lat_len]
+    return tuple(bits_to_geohash(i | j, len(geohash)) for i in lon_list for j in lat_list)
+
+
+def parent(geohash: str) -> str:
+    """
+    Gives the geohash one character shorter whose box holds the given one.
+    :param geohash: Geohash string
+    :return: Geohash string
+    """
+    if not geohash:
+        raise ValueError("An empty geohash is the whole world and has no parent.")
+    return geohash[:-1]
+
+
+def children(geohash: str) -> list:
+    """
+    Gives the 32 geohashes one character longer that make up the given geohash's box, in base32 order.
+    :param geohash: Geohash string
+    :return: list of 32 geohashes
+    """
+    return children_into(geohash, [])
+
+
+def children_into(geohash: str, out: list) -> list:
+    """
+    Same as children, but adds them onto a list you already have.  Saves making a new list per call when
+    walking down lots of boxes, e.g. filling a polygon.
+    :param geohash: Geohash string
+    :param out: list to add the children to
+    :return: out
+    """
+    out.extend([geohash + char for char in base32])
+    return out
+
+
+def encode_many(lons, lats, precision: int = 12):
+    """
+    Encode arrays of lon-lat pairs to geohashes in one go.  Needs numpy.
+    :param lons: Longitudes, anything numpy can turn into a float array
+    :param lats: Latitudes, same shape as lons
+    :param precision: Bits of precision, 1 to 12 so the bits fit in 64.
+    :return: numpy array of geohash strings, same shape as lons
+    """
+    if np is None:
+        raise ImportError("encode_many needs numpy")
+    if not 1 <= precision <= 12:
+        raise ValueError("encode_many supports precision 1 to 12")
+    total_bits = precision * 5
+    lon_len, lat_len = sum(divmod(total_bits, 2)), total_bits // 2
+    odd = lon_len - lat_len
+    lon_int = quantize_many(lons, lon_len, 180)
+    lat_int = quantize_many(lats, lat_len, 90)
+    geoint = spread_bits(lon_int) << np.uint64(1 - odd) | spread_bits(lat_int) << np.uint64(odd)
+    shifts = np.arange(total_bits - 5, -1, -5, dtype=np.uint64)
+    groups = geoint[..., np.newaxis] >> shifts & np.uint64(31)
+    chars = np.frombuffer(''.join(base32).encode(), dtype=np.uint8)[groups]
+    return chars.view('S{}'.format(precision))[..., 0].astype(str)
+
+
+def quantize_many(degrees, length: int, range_ends: int):
+    """
+    quantize over a whole array.  Needs numpy.
+    :param degrees: lons or lats, anything numpy can turn into a float array
+    :param length: Number of bits for this axis, up to 32
+    :param range_ends: 180 or 90 for lon or lat, respectively
+    :return: numpy uint64 array of cell indexes
+    """
+    cells = 1 << length
+    degrees = np.asarray(degrees, dtype=np.float64)
+    degrees = np.where(np.isnan(degrees), -range_ends, np.clip(degrees, -range_ends, range_ends))
+    index = np.maximum(np.ceil((degrees + range_ends) / (2 * range_ends) * cells) - 1, 0)
+    # Same exact edge check as quantize.  Up to 32 bits the float estimate is never more than one cell low.
+    edge = (index + 1) * (2 * range_ends) / cells - range_ends
+    index = np.where((index < cells - 1) & (degrees > edge), index + 1, index)
+    return index.astype(np.uint64)
+
+
+def decode_many(geohashes):
+    """
+    Decode an array of geohashes to points in one go.  Needs numpy.
+    Geohashes can be of mixed lengths, up to 12 characters.
+    :param geohashes: Geohash strings, anything numpy can turn into an array
+    :return: DecodedArrays of lons, lats, lon_errs and lat_errs, one numpy array each, shaped like geohashes
+    """
+    if np is None:
+        raise ImportError("decode_many needs numpy")
+    strings = np.asarray(geohashes, dtype=object)
+    shape = strings.shape
+    strings = strings.ravel().tolist()
+    # numpy strings drop trailing NULs, which would quietly shorten a geohash instead of rejecting it.
+    if '\x00' in ''.join(strings):
+        raise ValueError("Invalid geohash character.  Use 0-9, b-h, j, k, m, n, p-z.")
+    try:
+        hashes = np.array(strings, dtype='S')
+    except UnicodeEncodeError:
+        raise ValueError("Invalid geohash character.  Use 0-9, b-h, j, k, m, n, p-z.") from None
+    width = hashes.dtype.itemsize
+    if width > 12:
+        raise ValueError("decode_many supports geohashes up to 12 characters")
+    lut = np.frombuffer(lut32 + bytes([255]) * 128, dtype=np.uint8)
+    values = lut[hashes.view(np.uint8).reshape(len(hashes), width)]
+    lengths = np.char.str_len(hashes)
+    in_hash = np.arange(width) < lengths[:, np.newaxis]
+    if (values[in_hash] == 255).any():
+        raise ValueError("Invalid geohash character.  Use 0-9, b-h, j, k, m, n, p-z.")
+    values[~in_hash] = 0
+    geoint = np.zeros(len(hashes), dtype=np.uint64)
+    for column in values.T:
+        geoint = geoint << np.uint64(5) | column
+    total_bits = (lengths * 5).astype(np.uint64)
+    geoint >>= np.uint64(width * 5) - total_bits
+    odd = total_bits & np.uint64(1)
+    lon_len = (total_bits + odd) // np.uint64(2)
+    lat_len = total_bits // np.uint64(2)
+    lon_int = compact_bits(geoint >> (np.uint64(1) - odd))
+    lat_int = compact_bits(geoint >> odd)
+    lon_err = np.ldexp(180.0, -lon_len.astype(np.int64))
+    lat_err = np.ldexp(90.0, -lat_len.astype(np.int64))
+    lons, lats = (2 * lon_int + 1) * lon_err - 180, (2 * lat_int + 1) * lat_err - 90
+    return DecodedArrays(lons.reshape(shape), lats.reshape(shape), lon_err.reshape(shape), lat_err.reshape(shape))
+
+
+def spread_bits(x):
+    """
+    Spreads the low 32 bits of x out to every other bit, the Morton interleave step.  Works on ints or numpy uint64s.
+    :param x: int or numpy uint64 array
+    :return: x with a zero bit after each of its bits
+    """
+    x = (x | x << 16) & 0x0000FFFF0000FFFF
+    x = (x | x << 8) & 0x00FF00FF00FF00FF
+    x = (x | x << 4) & 0x0F0F0F0F0F0F0F0F
+    x = (x | x << 2) & 0x3333333333333333
+    return (x | x << 1) & 0x5555555555555555
+
+
+def compact_bits(x):
+    """
+    Gathers every other bit of x, starting at bit 0, back together.  Inverse of spread_bits.
+    :param x: int or numpy uint64 array
+    :return: the even bits of x, packed
+    """
+    x &= 0x5555555555555555
+    x = (x | x >> 1) & 0x3333333333333333
+    x = (x | x >> 2) & 0x0F0F0F0F0F0F0F0F
+    x = (x | x >> 4) & 0x00FF00FF00FF00FF
+    x = (x | x >> 8) & 0x0000FFFF0000FFFF
+    return (x | x >> 16) & 0x00000000FFFFFFFF
+
+
+def geohash_to_int(geohash: str) -> int:
+    """
+    Geohash in, bits out as a single int.  Converts the whole string at once rather than char by char.
+    :param geohash: string of the geohash
+    :return: geohash bits as an int, len(geohash) * 5 long
+    """
+    if not geohash.isascii():
+        raise ValueError("Invalid geohash character.  Use 0-9, b-h, j, k, m, n, p-z.")
+    try:
+        return int(geohash.translate(trans32) or '0', 32)
+    except ValueError:
+        raise ValueError("Invalid geohash character.  Use 0-9, b-h, j, k, m, n, p-z.") from None
 
 
 def get_geobits(geohash: str) -> str:
@@ -139,13 +483,13 @@ def get_geobits(geohash: str) -> str:
     :param geohash: string of the geohash
     :return: string of 1s and 0s.  Must be string to retain prepended zeroes and maintain length.
     """
-    geobits = ''
+    geobits = []
     for i in geohash:
-        try:
-            geobits += str(bin(dict32[i])[2:].zfill(5))
-        except KeyError:
+        value = lut32[ord(i)] if i < '\x80' else 255
+        if value == 255:
             return "Invalid geohash character.  Use 0-9, b-h, j, k, m, n, p-z."
-    return geobits
+        geobits.append(bits32[value])
+    return ''.join(geobits)
 
 
 # print(decode('c22yzv5cw8te'))
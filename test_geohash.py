@@ -0,0 +1,167 @@
+# Checks that the fast encode paths put points right next to cell edges in the same cell as the original bisection.
+
+from math import nextafter
+
+import pytest
+
+import geohash
+
+
+def bisect_encode(lon: float, lat: float, precision: int) -> str:
+    """
+    The original bit by bit bisection encode, to check the fast paths against.
+    """
+    ranges = [[-180.0, 180.0], [-90.0, 90.0]]
+    value = 0
+    for i in range(precision * 5):
+        tup_range = ranges[i % 2]
+        mid = (tup_range[0] + tup_range[1]) / 2
+        bit = (lon, lat)[i % 2] > mid
+        tup_range[not bit] = mid
+        value = value << 1 | bit
+    return geohash.bits_to_geohash(value, precision)
+
+
+def pure_encode(lon: float, lat: float, precision: int) -> str:
+    total_bits = precision * 5
+    lon_len, lat_len = sum(divmod(total_bits, 2)), total_bits // 2
+    return geohash.ints_to_geohash(geohash.quantize(lon, lon_len, 180), geohash.quantize(lat, lat_len, 90), precision)
+
+
+def edge_points() -> list:
+    """
+    Points on, and one ulp either side of, cell edges at every level, plus the special values.
+    """
+    points = []
+    for level in range(1, 60):
+        for edge in (0.5, 0.25 + 2.0 ** -level, 1 - 2.0 ** -level):
+            lon, lat = edge * 360 - 180, edge * 180 - 90
+            for step in (-1, 0, 1):
+                points.append((nextafter(lon, step * 200.0) if step else lon,
+                               nextafter(lat, step * 100.0) if step else lat))
+    points += [(1e-15, 1e-15), (-1e-15, -1e-15), (90.00000000000001, 45.000000000000014), (180.0, 90.0),
+               (-180.0, -90.0), (200.0, 100.0), (-200.0, -100.0), (float('nan'), float('nan')),
+               (float('inf'), float('inf')), (float('-inf'), float('-inf'))]
+    return points
+
+
+@pytest.mark.parametrize('precision', [1, 5, 11, 12, 17, 18, 20, 22])
+def test_pure_encode_matches_bisection_at_edges(precision):
+    for lon, lat in edge_points():
+        assert pure_encode(lon, lat, precision) == bisect_encode(lon, lat, precision), (lon, lat)
+
+
+@pytest.mark.parametrize('precision', [1, 5, 11, 12, 17, 18, 20, 22])
+def test_pure_encode_matches_numba_at_edges(precision):
+    geohash_numba = pytest.importorskip('geohash_numba')
+    for lon, lat in edge_points():
+        assert pure_encode(lon, lat, precision) == geohash_numba.numba_encode(lon, lat, precision), (lon, lat)
+
+
+def test_pure_encode_matches_bisection_past_exact_edges():
+    assert pure_encode(-157.11231629391267, -81.75656236651253, 20) == \
+        bisect_encode(-157.11231629391267, -81.75656236651253, 20)
+
+
+def test_encode_p12_matches_bisection_at_edges():
+    for lon, lat in edge_points():
+        assert geohash.encode_p12(lon, lat) == bisect_encode(lon, lat, 12), (lon, lat)
+
+
+@pytest.mark.parametrize('precision', [1, 5, 11, 12])
+def test_encode_many_matches_bisection_at_edges(precision):
+    pytest.importorskip('numpy')
+    lons, lats = zip(*edge_points())
+    assert list(geohash.encode_many(lons, lats, precision)) == [bisect_encode(lon, lat, precision)
+                                                                  for lon, lat in edge_points()]
+
+
+def test_decode_many_rejects_non_ascii():
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        geohash.decode_many(['c2', '\xe9'])
+
+
+def test_neighbors_order():
+    assert geohash.neighbors('c22yzv') == ['c22yzw', 'c22yzt', 'c22yzs', 'c22yzy', 'c22yzv', 'c22yzu',
+                                           'c23nbn', 'c23nbj', 'c23nbh']
+
+
+def test_neighbors_at_the_poles():
+    assert geohash.neighbors('b') == ['z', 'x', 'b', '8', 'c', '9']
+    assert geohash.neighbors('0') == ['r', 'p', '2', '0', '3', '1']
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('b', ['z', 'x', 'b', '8', 'c', '9']),  # odd length, top row, lon_int 0
+    ('zz', ['zx', 'zw', 'zz', 'zy', 'bp', 'bn']),  # even length, top row, lon_int at the max
+    ('00', ['pc', 'pb', '01', '00', '03', '02']),  # even length, bottom row, lon_int 0
+    ('pbp', ['pbq', 'pbn', 'pbr', 'pbp', '002', '000']),  # odd length, bottom row, lon_int at the max
+    ('8', ['z', 'x', 'r', 'b', '8', '2', 'c', '9', '3']),  # middle row, lon_int 0
+])
+def test_neighbors_wrap_the_date_line(cell, expected):
+    assert geohash.neighbors(cell) == expected
+
+
+@pytest.mark.parametrize('length', [1, 2, 5, 6])
+def test_neighbors_of_edge_columns(length):
+    lon_len, lat_len = sum(divmod(length * 5, 2)), length * 5 // 2
+    for lon_int in (0, (1 << lon_len) - 1):
+        for lat_int in (0, 1, (1 << lat_len) - 2, (1 << lat_len) - 1):
+            cell = geohash.ints_to_geohash(lon_int, lat_int, length)
+            rows = 2 if lat_int in (0, (1 << lat_len) - 1) else 3
+            cells = [geohash.decode_to_ints(c)[:2] for c in geohash.neighbors(cell)]
+            assert len(cells) == 3 * rows, cell
+            assert {(lon_int + d) % (1 << lon_len) for d in (-1, 0, 1)} == {i for i, _ in cells}, cell
+            assert all(abs(j - lat_int) <= 1 for _, j in cells), cell
+
+
+def test_neighbors_returns_a_fresh_list():
+    first = geohash.neighbors('c22yzv')
+    first.append('junk')
+    assert geohash.neighbors('c22yzv') == first[:-1]
+
+
+def test_decode_many_keeps_the_input_shape():
+    pytest.importorskip('numpy')
+    cells = geohash.decode_many([['c2', '9q'], ['', 'u4pruydqqvj']])
+    assert cells.lons.shape == cells.lats.shape == cells.lon_errs.shape == cells.lat_errs.shape == (2, 2)
+    assert cells.to_cells()[3] == geohash.decode_many(['u4pruydqqvj']).to_cells()[0]
+
+
+@pytest.mark.parametrize('geohashes', [['c2\x00'], ['\x00'], ['c2', '\x00c2']])
+def test_decode_many_rejects_nul(geohashes):
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        geohash.decode_many(geohashes)
+
+
+def test_decode_many_matches_decode():
+    pytest.importorskip('numpy')
+    hashes = ['c22yzv5cw8te'[:length] for length in range(13)] + ['0', 'zzzzzzzzzzzz', 'pbp', 'b']
+    cells = geohash.decode_many(hashes)
+    for i, h in enumerate(hashes):
+        lat, lon, lat_err, lon_err = geohash.decode(h, 'pointerr')
+        assert (cells.lons[i], cells.lats[i], cells.lon_errs[i], cells.lat_errs[i]) == (lon, lat, lon_err, lat_err), h
+        assert cells.to_cells()[i] == (lon, lat, lon_err, lat_err), h
+
+
+@pytest.mark.parametrize('cell', ['c22yzv5cw8tezzbp0k7m', 'zzzzzzzzzzzzzzzzzzzz', '00000000000000000000'])
+def test_decode_point_matches_decode(cell):
+    # Up to 12 characters decode_point works on the packed int, and decode goes through numba when it's installed.
+    for length in range(21):
+        assert geohash.decode_point(cell[:length]) == tuple(geohash.decode(cell[:length], 'pointerr')[1::-1]), length
+
+
+def test_children_into_appends_to_the_given_list():
+    out = ['c2']
+    assert geohash.children_into('c2', out) is out
+    assert out == ['c2'] + geohash.children('c2')
+    assert len(out) == 33
+
+
+def test_parent():
+    assert geohash.parent(geohash.children('c2')[5]) == 'c2'
+    assert all(geohash.parent(child) == 'c2' for child in geohash.children('c2'))
+    with pytest.raises(ValueError):
+        geohash.parent('')